@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+from types import MethodType
+from typing import Any
+
 from cerberus import TypeDefinition, Validator
 from tinydb.table import Table
 
 __all__ = ('FieldSheet')
 
+# Shared, schema-less validator used only to check rule definitions, so a
+# rule check no longer has to construct a new Validator.
+_rule_validator = Validator({})
+
+
+def _validate_rules(field: str, rules: dict) -> None:
+    # Raises cerberus.SchemaError when a rule or its value is not valid.
+    _schema = _rule_validator.schema
+    _schema.validate(_schema.expand({field: dict(rules)}))
+
+
+def _validate_rule(field: str, rule: str, value) -> None:
+    _validate_rules(field, {rule: value})
+
 
 class FieldSheet(dict):
 
@@ -27,6 +44,9 @@ class FieldSheet(dict):
     }
     """
 
+    # Rule setters built by __getattr__, shared by every FieldSheet.
+    _setters = {}
+
     def __init__(self, name: str):
         """
         :param name: The string used as field name. Posicional only.
@@ -48,6 +68,11 @@ class FieldSheet(dict):
 
     def type(self, type_: type) -> 'FieldSheet':
         # Data type allowed for the key value.
+        self._register_type(type_)
+        return self
+
+    def _register_type(self, type_: type) -> str:
+        # Returns the Cerberus type name registered for type_.
         if hasattr(type_, '__name__'):
             type_name = type_.__name__
         elif hasattr(type_.__class__, '__name__'):
@@ -59,13 +84,37 @@ class FieldSheet(dict):
 
         try:
             # Applying custom type validation with Cerberus TypeDefinition.
-            if type_name not in list(Validator.types_mapping.keys()):
+            if type_name not in Validator.types_mapping:
                 Validator.types_mapping[type_name] = TypeDefinition(
                     type_name, (type_,), ())
         except Exception:
             raise TypeError('Could not assign {} as a type'.format(type_))
         else:
-            return self
+            return type_name
+
+    def set(self, **rules: Any) -> 'FieldSheet':
+        """
+        Assign several rules at once, validating them together.
+
+        >>> FieldSheet('name').set(required=True, empty=False)
+        {
+            "name": {
+                "required": True,
+                "empty": False
+            }
+        }
+        """
+        if 'type' in rules:
+            _type = rules['type']
+            if isinstance(_type, list):
+                rules['type'] = [self._register_type(t)
+                                 if isinstance(t, type) else t
+                                 for t in _type]
+            elif isinstance(_type, type):
+                rules['type'] = self._register_type(_type)
+        _validate_rules(self._name, rules)
+        self['_schema'][self._name].update(rules)
+        return self
 
     def __getattr__(self, method):
         """
@@ -73,12 +122,21 @@ class FieldSheet(dict):
         method as key. Returning instance of itself.
         Inspiration: https://stackoverflow.com/a/61120452/15560677
         """
-        def value_reciever(value):
-            # There are no concrete methods being setted.
-            Validator({self.name: {method: value}}).schema.validate()
-            self['_schema'][self.name][method] = value
-            return self
-        return value_reciever
+        if method.startswith('_'):
+            # Private and dunder lookups (copy, pickle) are never rules.
+            raise AttributeError(method)
+
+        value_reciever = self._setters.get(method)
+        if value_reciever is None:
+            def value_reciever(self, value):
+                # There are no concrete methods being setted.
+                _validate_rule(self.name, method, value)
+                self['_schema'][self.name][method] = value
+                return self
+            # Only known rules are kept, not typos or hasattr() probes.
+            if method in Validator.rules:
+                self._setters[method] = value_reciever
+        return MethodType(value_reciever, self)
 
     def __repr__(self):
         return '{}'.format(self['_schema'])
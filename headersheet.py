@@ -4,7 +4,7 @@ from typing import Any, Union
 
 from cerberus import TypeDefinition, Validator
 from tinydb.table import Table
-from tinysheet.fieldsheet import FieldSheet
+from tinysheet.fieldsheet import FieldSheet, _validate_rule
 
 __all__ = ('HeaderSheet')
 
@@ -26,6 +26,7 @@ class HeaderSheet(dict):
         :param name: The string used as field name. Posicional only.
         """
         self._name = name
+        self._fields_cache = None
         self['_schema'] = {}
 
     @property
@@ -34,7 +35,9 @@ class HeaderSheet(dict):
 
     @schema.deleter
     def schema(self):
-        self['_schema'] = {}
+        # Cleared in place, tables built on this header keep a reference.
+        self['_schema'].clear()
+        self._fields_cache = None
 
     def add(self, *fields: Union[str, FieldSheet]) -> 'HeaderSheet':
         """
@@ -68,11 +71,12 @@ class HeaderSheet(dict):
             }
         }
         """
-        for field in list(fields):
+        for field in fields:
             if isinstance(field, str):
                 field = FieldSheet(field)
             if isinstance(field, FieldSheet):
-                self['_schema'] = {**self['_schema'], **field.schema}
+                self['_schema'].update(field.schema)
+        self._fields_cache = None
         return self
 
     def registry(self, table: Table, name: str = None):
@@ -91,7 +95,9 @@ class HeaderSheet(dict):
             }
         }
         """
-        for field in list(fields):
+        # Dropped first, pop() may raise after removing earlier fields.
+        self._fields_cache = None
+        for field in fields:
             if isinstance(field, str):
                 field = FieldSheet(field)
             if isinstance(field, FieldSheet):
@@ -162,7 +168,7 @@ class HeaderSheet(dict):
 
         if rule == 'type':
             try:
-                if value.__name__ not in list(Validator.types_mapping.keys()):
+                if value.__name__ not in Validator.types_mapping:
                     Validator.types_mapping[value.__name__] = TypeDefinition(
                         value.__name__, (value,), ())
 
@@ -171,16 +177,21 @@ class HeaderSheet(dict):
                 raise TypeError('Could not assign {} as a type'.format(value))
 
         if fields is None:
-            fields = list(self['_schema'].keys())
+            fields = self.all_fields()
 
         if isinstance(fields, str):
-            Validator({fields: {rule: value}}).schema.validate()
+            _validate_rule(fields, rule, value)
             self['_schema'][fields][rule] = value
         elif isinstance(fields, list):
+            # The rule definition does not depend on the field, check it once.
+            _checked = False
+            _schema = self['_schema']
             for k in fields:
-                if str(k) in list(self['_schema'].keys()):
-                    Validator({str(k): {rule: value}}).schema.validate()
-                    self['_schema'][str(k)][rule] = value
+                if str(k) in _schema:
+                    if not _checked:
+                        _validate_rule(str(k), rule, value)
+                        _checked = True
+                    _schema[str(k)][rule] = value
         return self
 
     def all_fields(self) -> list[str]:
@@ -188,7 +199,11 @@ class HeaderSheet(dict):
         >>> profile.all_fields()
         ['name', 'phone', 'gender']
         """
-        return list(self['_schema'].keys())
+        # Shared until the next add, remove or schema delete, callers must not
+        # mutate it. Fields written straight into the schema are not seen.
+        if self._fields_cache is None:
+            self._fields_cache = list(self['_schema'].keys())
+        return self._fields_cache
 
     def seek(self, rule: str, value: Any = '___missing_value') -> list[str]:
         """
@@ -198,10 +213,9 @@ class HeaderSheet(dict):
         ['name', 'phone']
         """
         _fields = []
-        for field in list(self['_schema'].keys()):
-            if rule in self['_schema'][field]:
-                if self['_schema'][field][rule] == value or (
-                        value == '___missing_value'):
+        for field, rules in self['_schema'].items():
+            if rule in rules:
+                if rules[rule] == value or value == '___missing_value':
                     _fields.append(field)
         return _fields
 
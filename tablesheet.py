@@ -32,6 +32,8 @@ class BareTable(Table):
         return super().insert(self.validated(document))
 
     def insert_multiple(self, documents: Iterable[Mapping]) -> List[int]:
+        # Validated up front: TinyDB hands out doc ids while it consumes the
+        # documents, so a failure inside it would still use up ids.
         return super().insert_multiple(
             [self.validated(document) for document in documents])
 
@@ -49,18 +51,17 @@ class BareTable(Table):
             Tuple[Union[Mapping, Callable[[Mapping], None]], Query]
         ],
     ) -> List[int]:
+        # TinyDB walks the updates once per document, so they are kept in a
+        # list rather than passed as a generator.
         new_updates = []
-        for update in updates:
-            update = list(update)
-            update[0] = self.validated(update[0])
-            update = tuple(update)
-            new_updates.append(update)
+        for fields, cond in updates:
+            new_updates.append((self.validated(fields), cond))
         return super().update_multiple(new_updates)
 
     #######################################################################
 
     def raw(self) -> dict:
-        return dict(zip(self.get_ids(self.all()), self.all()))
+        return {document.doc_id: document for document in self.all()}
 
     def get_ordered(
         self,
@@ -71,19 +72,17 @@ class BareTable(Table):
         if isinstance(documents, interval):
             documents = self.get_docs(documents)
         by = by if isinstance(by, list) else list(by)
+        _header_fields = self.header.all_fields()
+        _fields = [key for key in by if key in _header_fields]
         return sorted(documents,
-                      key=lambda dict: list(
-                          dict[key].doc_id for key in by if key in [
-                              *self.header.all_fields()]),
+                      key=lambda doc: [doc[key].doc_id for key in _fields],
                       reverse=reverse)
 
     def get_docs(self, doc_ids: interval) -> List[dict]:
-        _doc_list = []
-        for _id in self._interval(doc_ids):
-            if self.get(doc_id=_id) is not None:
-                _doc_list.append(self.get(doc_id=_id))
-
-        return _doc_list
+        # A single table read instead of one get() per requested id.
+        _docs_by_id = {doc.doc_id: doc for doc in self.all()}
+        return [_docs_by_id[_id] for _id in self._interval(doc_ids)
+                if _id in _docs_by_id]
 
     def get_ids(self, documents: List[dict]) -> List[int]:
         doc_ids = []
@@ -103,15 +102,12 @@ class BareTable(Table):
                 if len(doc_id) != 2:
                     raise Exception('Set must contain only 2 integers')
                 else:
-                    _s = list(doc_id)[0]
-                    _e = list(doc_id)[1]
-                    while _s <= _e:
-                        _doc_id_set.add(_s)
-                        _s += 1
+                    _s, _e = sorted(doc_id)
+                    _doc_id_set.update(range(_s, _e + 1))
             else:
                 raise TypeError('doc_ids must be interval type.'
                                 'List[Union[int, Set[int]]]')
-        return list(_doc_id_set)
+        return sorted(_doc_id_set)
 
 ###############################################################################
 
@@ -119,26 +115,42 @@ class BareTable(Table):
 class DocModelFactory:
 
     def model(self, *, data: dict = None):
+        # Built once; it reads the shared rules dict, so rule and header
+        # changes reach it without rebuilding the class.
+        _validator_rules = self._cached_rules
+        type_model = self._model_class
+        if type_model is not None:
+            return type_model if data is None else type_model(data)
+
         class BaseModelObject(dict):
-            def __init__(self, /, data: dict = data, **kwargs):
+            def __init__(self, /, data: dict = None, **kwargs):
                 if isinstance(data, dict):
-                    for key in list(data.keys()):
-                        setattr(self, key, data[key])
-                for k in list(kwargs.keys()):
-                    setattr(self, k, kwargs[k])
-
-            def _validate_args(self, key, value):
+                    for key, val in data.items():
+                        setattr(self, key, val)
+                for k, v in kwargs.items():
+                    setattr(self, k, v)
+
+            def _field_validator(self, key, rules):
+                # Reused while the field keeps the same rules object.
+                _cached = self._field_validators.get(key)
+                if _cached is not None and _cached[0] is rules:
+                    return _cached[1]
                 _r = ({k: v for k, v in self._validator_rules.items()
                        if k != 'schema'})
-                if key in list(self._validator_rules['schema'].keys()):
-                    _s = {key: self._validator_rules['schema'].get(key)}
-                    _v = Validator(schema=_s, **_r)
+                _v = Validator(schema={key: rules}, **_r)
+                self._field_validators[key] = (rules, _v)
+                return _v
+
+            def _validate_args(self, key, value):
+                if key in self._validator_rules['schema']:
+                    _v = self._field_validator(
+                        key, self._validator_rules['schema'][key])
                     _result = _v.validated({key: value})
                 else:
                     if isinstance(
                             self._validator_rules['allow_unknown'], dict):
-                        _s = {key: self._validator_rules['allow_unknown']}
-                        _v = Validator(schema=_s, **_r)
+                        _v = self._field_validator(
+                            key, self._validator_rules['allow_unknown'])
                         _result = _v.validated({key: value})
                     else:
                         _result = ({key: value}
@@ -150,35 +162,41 @@ class DocModelFactory:
                         'Validation Errors: {}'.format(_v.errors))
                 return _result
 
+            def __getattribute__(self, key):
+                # Values are only stored in the dict itself; stored fields
+                # win over dict methods such as items or keys.
+                if not key.startswith('__') and dict.__contains__(self, key):
+                    return dict.__getitem__(self, key)
+                return super().__getattribute__(key)
+
             def __setattr__(self, key, value):
                 newvalue = self._validate_args(key, value)[key]
-                super().__setattr__(key, newvalue)
                 super().__setitem__(key, newvalue)
 
             def __setitem__(self, key, value):
-                newvalue = self._validate_args(key, value)[key]
-                super().__setattr__(key, newvalue)
-                super().__setitem__(key, newvalue)
+                self.__setattr__(key, value)
 
             def __repr__(self):
-                return '{}({})'.format(self.__name__, self.__dict__)
+                return '{}({})'.format(self.__name__, dict(self))
 
             def validated(self):
                 _v = Validator(**self._validator_rules)
-                _result = _v.validated(self.__dict__)
+                _result = _v.validated(dict(self))
                 if _result is None:
                     raise Exception(
                         'Validation Errors: {}'.format(_v.errors))
                 return _result
         _obj_methods = {
             '__name__': '{}_model'.format(self._name),
-            '_validator_rules': self._set_validator_rules(),
+            '_validator_rules': _validator_rules,
+            '_field_validators': self._field_validators,
         }
 
         type_model = type(
             '{}_model'.format(self._name),
             (BaseModelObject,),
             _obj_methods)
+        self._model_class = type_model
 
         return type_model if data is None else type_model(data)
 
@@ -203,8 +221,8 @@ class ValidatedTable(BareTable, DocModelFactory):
         super().__init__(storage, name)
 
         self._schema_registry = schema_registry
+        self._model_class = None
 
-        self._schema = schema
         self._allow_unknown = allow_unknown
         self._ignore_none_values = ignore_none_values
         self._normalize = normalize
@@ -212,16 +230,29 @@ class ValidatedTable(BareTable, DocModelFactory):
         self._purge_readonly = purge_readonly
         self._require_all = require_all
 
+        # Kept in sync by the setters, so it is only built once per table.
+        self._cached_rules = self._set_validator_rules(schema=schema)
+        # Compiled up front, so inserts and updates never build one.
+        self._validator = self._get_validator()
+        self._field_validators = {}
+
     ######################################################################
 
     @property
     def validator(self) -> Validator:
-        return self._get_validator()
+        # Rebuilt on the next access after a rule or the header changes.
+        if self._validator is None:
+            self._validator = self._get_validator()
+        return self._validator
+
+    def _invalidate_validator(self):
+        self._validator = None
+        self._field_validators.clear()
 
     def _get_validator(self, **kwargs):
         _validator_rules = (self._set_validator_rules(**kwargs)
                             if kwargs
-                            else self._set_validator_rules())
+                            else self._cached_rules)
         return Validator(**_validator_rules)
 
     def _set_validator_rules(
@@ -277,10 +308,13 @@ class ValidatedTable(BareTable, DocModelFactory):
         if not _validator.validate(document):
             raise Exception('Validation Errors: {}'.format(
                 _validator.errors))
-        return _validator.validated(document)
+        # The normalized document of the run above, no second validation.
+        return _validator.document
 
     def validate_errors(self, document: dict) -> Any:
-        return self.validator.validate(document).errors
+        _validator = self.validator
+        _validator.validate(document)
+        return _validator.errors
 
 
 ###############################################################################
@@ -297,15 +331,14 @@ class TableSheet(ValidatedTable):
     ):
         self._name = name
         self._header = header if header is not None else HeaderSheet(
-            '{self._name}_header'.format)
-        self._schema = self._header['_schema']
+            '{}_header'.format(self._name))
 
         self._kwargs = kwargs
 
         super().__init__(
             storage,
             name,
-            schema=self._schema,
+            schema=self._header['_schema'],
             **self._kwargs
         )
 
@@ -323,8 +356,11 @@ class TableSheet(ValidatedTable):
                     other.__class__)
             )
         self._header = other
-        for field in list(other['_schema'].keys()):
-            self._schema_registry.add(field, {field: other['_schema'][field]})
+        self._cached_rules['schema'] = other['_schema']
+        self._invalidate_validator()
+        self._schema_registry.extend(
+            (field, {field: rules})
+            for field, rules in other['_schema'].items())
 
     #######################################################################
 
@@ -358,6 +394,8 @@ class TableSheet(ValidatedTable):
                     value.__class__)
             )
         self._allow_unknown = value
+        self._cached_rules['allow_unknown'] = value
+        self._invalidate_validator()
 
     #######################################################################
     @property
@@ -371,6 +409,8 @@ class TableSheet(ValidatedTable):
                 '{} is not a bool type object.'.format(
                     value.__class__))
         self._ignore_none_values = value
+        self._cached_rules['ignore_none_values'] = value
+        self._invalidate_validator()
 
     #######################################################################
 
@@ -385,6 +425,8 @@ class TableSheet(ValidatedTable):
                 '{} is not a bool type object.'.format(
                     value.__class__))
         self._normalize = value
+        self._cached_rules['normalize'] = value
+        self._invalidate_validator()
 
     #######################################################################
 
@@ -399,6 +441,8 @@ class TableSheet(ValidatedTable):
                 '{} is not a bool type object.'.format(
                     value.__class__))
         self._purge_unknown = value
+        self._cached_rules['purge_unknown'] = value
+        self._invalidate_validator()
 
     #######################################################################
 
@@ -413,6 +457,8 @@ class TableSheet(ValidatedTable):
                 '{} is not a bool type object.'.format(
                     value.__class__))
         self._purge_readonly = value
+        self._cached_rules['purge_readonly'] = value
+        self._invalidate_validator()
 
     #######################################################################
 
@@ -427,6 +473,8 @@ class TableSheet(ValidatedTable):
                 '{} is not a bool type object.'.format(
                     value.__class__))
         self._require_all = value
+        self._cached_rules['require_all'] = value
+        self._invalidate_validator()
 
     #######################################################################
 
@@ -0,0 +1,20 @@
+import pytest
+from cerberus import SchemaError
+from tinysheet.fieldsheet import FieldSheet
+
+
+def test_set_converts_type_class():
+    field = FieldSheet('age').set(type=int, required=True)
+    assert field.schema == {'age': {'type': 'int', 'required': True}}
+
+
+def test_set_keeps_type_list():
+    field = FieldSheet('id').set(type=['integer', str])
+    assert field.schema == {'id': {'type': ['integer', 'str']}}
+
+
+def test_set_invalid_rule_raises():
+    with pytest.raises(SchemaError):
+        FieldSheet('age').set(required='yes')
+    with pytest.raises(SchemaError):
+        FieldSheet('age').set(bogus=1)
@@ -0,0 +1,9 @@
+from tinysheet.tinysheet import TinySheet
+
+
+def test_model_field_named_like_dict_method(tmp_path):
+    table = TinySheet(str(tmp_path / 'db.json')).sheet('people')
+    obj = table.model(data={'items': [1, 2]})
+    assert obj.items == [1, 2]
+    assert obj['items'] == [1, 2]
+    assert dict(obj) == {'items': [1, 2]}
@@ -9,15 +9,20 @@ class TinySheet(TinyDB):
 
     def sheet(self, name: str, **kwargs) -> TableSheet:
 
+        table = self._tables.get(name)
+        if table is not None:
+            return table
+
+        # Companion tables are kept, so they must not share the caller's
+        # header or rules.
         _recycled = '{}_recycled'.format(name)
         if _recycled not in self._tables:
-            self.table_class(self.storage, _recycled, **kwargs)
+            self._tables[_recycled] = self.table_class(
+                self.storage, _recycled)
 
         if '_config' not in self._tables:
-            self.table_class(self.storage, '_config', **kwargs)
-
-        if name in self._tables:
-            return self._tables[name]
+            self._tables['_config'] = self.table_class(
+                self.storage, '_config')
 
         table = self.table_class(self.storage, name, **kwargs)
         self._tables[name] = table